@@ -1,9 +1,13 @@
 import requests
-import json
+import orjson
 from urllib.parse import urljoin
 import os
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
+from urllib3.util.retry import Retry
 import html2text
 from dotenv import load_dotenv
 
@@ -32,13 +36,84 @@ users_endpoint = urljoin(instance_url, '/api/now/table/sys_user')
 # Set headers for API requests
 headers = {
     "Content-Type": "application/json",
-    "Accept": "application/json"
+    "Accept": "application/json",
+    "Accept-Encoding": "gzip, deflate",  # Article bodies compress well; responses are decompressed transparently
+    "Connection": "keep-alive"
 }
 
+# Number of articles processed concurrently, optionally overridden from the environment
+max_workers_setting = os.getenv('SERVICENOW_MAX_WORKERS', '').strip()
+try:
+    max_workers = int(max_workers_setting) if max_workers_setting else 16
+    if max_workers < 1:
+        raise ValueError
+except ValueError:
+    print("Error: SERVICENOW_MAX_WORKERS must be a positive integer. Please check your .env file.")
+    sys.exit(1)
+
+# Connect and read timeouts in seconds, so a stalled request fails and is retried instead of hanging
+request_timeout = (10, 60)
+
+# Shared session so every API call reuses pooled keep-alive connections
+session = requests.Session()
+session.auth = (username, password)
+session.headers.update(headers)
+
+# Retry transient failures (rate limiting, server errors) on GET requests with exponential backoff
+retry = Retry(
+    total=5,
+    backoff_factor=0.5,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset(['GET']),
+    respect_retry_after_header=True
+)
+session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=max_workers, max_retries=retry))
+
+# Article fields needed for export, requested in the listing so no per-article fetch is needed
+article_fields = ','.join([
+    'sys_id', 'short_description', 'title', 'text', 'author.sys_id',
+    'sys_created_on', 'sys_updated_on', 'view_count', 'rating',
+    'kb_knowledge_base.title', 'kb_category', 'kb_category.label'
+])
+
+# Translation table for sanitize_filename: invalid characters become underscores, spaces become dashes
+_sanitize_table = str.maketrans({**{char: '_' for char in '<>:"/\\|?*'}, ' ': '-'})
+
+# Folders already created during this run
+_created_dirs = set()
+
+# Runs of whitespace, and runs of blank lines where only the first is kept
+_whitespace_re = re.compile(r'\s+')
+_multiple_blank_lines_re = re.compile(r'(\n[^\S\n]*\n)(?:[^\S\n]*\n)+')
+
+# Articles per listing page; kept small since each record includes the full article body
+article_page_size = 100
+
+# Frontmatter keys and the article fields they are read from, in output order
+_frontmatter_fields = (
+    ('created_date', 'sys_created_on'),
+    ('updated_date', 'sys_updated_on'),
+    ('views', 'view_count'),
+    ('rating', 'rating'),
+    ('knowledge_base', 'kb_knowledge_base.title'),
+    ('category', 'kb_category.label'),
+    ('sys_id', 'sys_id')
+)
+
+# Cache of user details keyed by sys_id, shared across articles
+user_cache = {}
+user_batch_size = 100
+
 # Get knowledge bases to process based on the filter provided in the environment variables
 kb_filter = os.getenv('SERVICENOW_KNOWLEDGE_BASES', '').strip()
 selected_kbs = [kb.strip() for kb in kb_filter.split(',')] if kb_filter else []
 
+class ServiceNowRequestError(Exception):
+    """Raised when a request to the ServiceNow API fails"""
+
+class ServiceNowAuthError(ServiceNowRequestError):
+    """Raised when the ServiceNow API rejects the configured credentials"""
+
 def make_request(method, url, **kwargs):
     """
     Make an HTTP request with error handling
@@ -46,34 +121,66 @@ def make_request(method, url, **kwargs):
     :param url: URL for the request
     :param kwargs: Additional arguments for the request
     :return: JSON response from the request
+    :raises ServiceNowRequestError: If the request fails or returns invalid JSON
     """
-    # Add basic authentication to request
-    kwargs['auth'] = (username, password)
+    kwargs.setdefault('timeout', request_timeout)
 
     try:
-        # Make the HTTP request
-        response = requests.request(method, url, **kwargs)
+        # Make the HTTP request using the shared session
+        response = session.request(method, url, **kwargs)
         response.raise_for_status()  # Raise an error for bad responses (4xx, 5xx)
-        return response.json()
+        return orjson.loads(response.content)
     except requests.exceptions.ConnectionError:
-        print(f"Error: Could not connect to {instance_url}. Please check your internet connection and the instance URL.")
-        sys.exit(1)
+        raise ServiceNowRequestError(f"Could not connect to {instance_url}. Please check your internet connection and the instance URL.")
     except requests.exceptions.Timeout:
-        print(f"Error: Request to {url} timed out. Please try again.")
-        sys.exit(1)
+        raise ServiceNowRequestError(f"Request to {url} timed out. Please try again.")
     except requests.exceptions.HTTPError as e:
-        print(f"Error: HTTP request failed: {e}")
         if response.status_code == 401:
-            print("Authentication failed. Please check your username and password.")
+            raise ServiceNowAuthError(f"HTTP request failed: {e}. Authentication failed. Please check your username and password.")
         elif response.status_code == 403:
-            print("Access forbidden. Please check your permissions.")
-        sys.exit(1)
+            raise ServiceNowAuthError(f"HTTP request failed: {e}. Access forbidden. Please check your permissions.")
+        raise ServiceNowRequestError(f"HTTP request failed: {e}")
     except requests.exceptions.RequestException as e:
-        print(f"Error: An unexpected error occurred: {e}")
-        sys.exit(1)
-    except json.JSONDecodeError:
-        print(f"Error: Received invalid JSON response from {url}")
-        sys.exit(1)
+        raise ServiceNowRequestError(f"An unexpected error occurred: {e}")
+    except orjson.JSONDecodeError:
+        raise ServiceNowRequestError(f"Received invalid JSON response from {url}")
+
+def paginated_pages(url, params=None, page_size=500):
+    """
+    Iterate over the pages of a table API listing
+    :param url: URL of the table API endpoint
+    :param params: Additional query parameters for the request
+    :param page_size: Number of records to request per page
+    :return: Generator yielding each page as a list of records
+    """
+    params = dict(params or {})
+    params['sysparm_limit'] = page_size
+
+    # Order by sys_id so offset paging is stable and never skips or repeats records
+    query = params.get('sysparm_query')
+    params['sysparm_query'] = f"{query}^ORDERBYsys_id" if query else 'ORDERBYsys_id'
+    offset = 0
+
+    while True:
+        params['sysparm_offset'] = offset
+        results = make_request('GET', url, params=params).get('result', [])
+
+        # Only an empty page marks the end; pages can come back short when ACLs filter out records
+        if not results:
+            break
+        yield results
+        offset += page_size
+
+def paginated_get(url, params=None, page_size=500):
+    """
+    Iterate over all records of a table API listing, one page at a time
+    :param url: URL of the table API endpoint
+    :param params: Additional query parameters for the request
+    :param page_size: Number of records to request per page
+    :return: Generator yielding each record in the listing
+    """
+    for page in paginated_pages(url, params, page_size):
+        yield from page
 
 def sanitize_filename(filename):
     """
@@ -84,21 +191,9 @@ def sanitize_filename(filename):
     if not filename:
         return "unnamed"
 
-    # Replace invalid characters with underscores
-    invalid_chars = '<>:"/\\|?*'
-    for char in invalid_chars:
-        filename = filename.replace(char, '_')
-
-    # Clean up whitespace
-    filename = ' '.join(filename.split())  # Replace multiple spaces/newlines with a single space
-    filename = filename.strip()  # Remove leading/trailing whitespace
-
-    # Replace remaining problematic characters
-    filename = filename.replace('\n', ' ')  # Replace newlines with space
-    filename = filename.replace('\t', ' ')  # Replace tabs with space
-
-    # Replace spaces with dashes
-    filename = filename.replace(' ', '-')
+    # Collapse whitespace, then replace invalid characters with underscores and spaces with dashes
+    filename = _whitespace_re.sub(' ', filename).strip()
+    filename = filename.translate(_sanitize_table)
 
     # Remove trailing underscores and dashes
     filename = filename.rstrip('_-')
@@ -106,17 +201,46 @@ def sanitize_filename(filename):
     # Limit filename length (optional, adjust as needed)
     max_length = 100
     if len(filename) > max_length:
-        filename = filename[:max_length].strip().rstrip('_-')
+        filename = filename[:max_length].rstrip('_-')
 
     return filename
 
 def create_folder(path):
     """
-    Create a folder if it doesn't exist
+    Create a folder if it doesn't exist, skipping folders already created during this run
     :param path: Path to the folder
     """
-    if not os.path.exists(path):
-        os.makedirs(path)
+    if path in _created_dirs:
+        return
+    os.makedirs(path, exist_ok=True)
+    _created_dirs.add(path)
+
+def write_file(path, data):
+    """
+    Write bytes to a file, replacing any existing content
+    :param path: Path to the file
+    :param data: Bytes to write
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o666)
+    try:
+        # os.write may write fewer bytes than requested, so keep writing until done
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+def _make_html_converter():
+    """
+    Create a new HTML to Markdown converter with the export's fixed configuration
+    :return: Configured html2text converter
+    """
+    converter = html2text.HTML2Text(bodywidth=0)  # Don't wrap text to keep formatting consistent
+    converter.ignore_emphasis = False
+    converter.ignore_links = False
+    converter.ignore_images = False
+    converter.ignore_tables = False
+    return converter
 
 def convert_html_to_markdown(html_content):
     """
@@ -124,33 +248,76 @@ def convert_html_to_markdown(html_content):
     :param html_content: HTML content to be converted
     :return: Converted Markdown content
     """
-    h = html2text.HTML2Text()
-    h.body_width = 0  # Don't wrap text to keep formatting consistent
-    h.ignore_emphasis = False
-    h.ignore_links = False
-    h.ignore_images = False
-    h.ignore_tables = False
-    return h.handle(html_content).strip()
+    # Articles without a body convert to nothing, so skip the parser entirely
+    if not html_content or html_content.isspace():
+        return ''
+
+    # html2text keeps parser state across documents, so each article gets a fresh converter
+    return _make_html_converter().handle(html_content).strip()
 
 def get_user_details(user_sys_id):
     """
-    Fetch user details from ServiceNow
+    Fetch user details from ServiceNow, using the cached entry when available
     :param user_sys_id: The system ID of the user
     :return: Dictionary containing user's name and sys_id
     """
     if not user_sys_id:
         return {"name": "Unknown", "sys_id": ""}
 
+    if user_sys_id in user_cache:
+        return user_cache[user_sys_id]
+
     try:
         # Make a request to get user details
-        response = make_request('GET', f"{users_endpoint}/{user_sys_id}", headers=headers)
-        user = response.get('result', {})
-        return {
-            "name": f"{user.get('first_name', '')} {user.get('last_name', '')}".strip() or "Unknown",
-            "sys_id": user_sys_id
-        }
+        response = make_request('GET', f"{users_endpoint}/{user_sys_id}")
+        user_details = _build_user_details(response.get('result', {}), user_sys_id)
     except Exception:
-        return {"name": "Unknown", "sys_id": user_sys_id}
+        # Cache failures too, so an unreadable user is looked up only once
+        user_details = {"name": "Unknown", "sys_id": user_sys_id}
+    user_cache[user_sys_id] = user_details
+    return user_details
+
+def prefetch_user_details(user_sys_ids):
+    """
+    Populate the user cache with a batched query for all uncached users
+    :param user_sys_ids: Iterable of user system IDs
+    """
+    pending = sorted({sys_id for sys_id in user_sys_ids if sys_id and sys_id not in user_cache})
+
+    # Query users in batches to keep the request URL to a reasonable length
+    for i in range(0, len(pending), user_batch_size):
+        batch = pending[i:i + user_batch_size]
+        params = {
+            'sysparm_query': f"sys_idIN{','.join(batch)}",
+            'sysparm_fields': 'sys_id,first_name,last_name',
+            'sysparm_limit': len(batch)
+        }
+        try:
+            response = make_request('GET', users_endpoint, params=params)
+        except Exception:
+            # Leave the remaining users to be fetched individually
+            continue
+        for user in response.get('result', []):
+            sys_id = user.get('sys_id')
+            if sys_id:
+                user_cache[sys_id] = _build_user_details(user, sys_id)
+
+        # Users missing from the result are deleted or hidden by ACLs, so don't look them up again
+        for sys_id in batch:
+            if sys_id not in user_cache:
+                user_cache[sys_id] = {"name": "Unknown", "sys_id": sys_id}
+
+def _build_user_details(user, user_sys_id):
+    """
+    Build the user details dictionary from a sys_user record
+    :param user: User record from ServiceNow
+    :param user_sys_id: The system ID of the user
+    :return: Dictionary containing user's name and sys_id
+    """
+    return {
+        "name": f"{user.get('first_name', '')} {user.get('last_name', '')}".strip() or "Unknown",
+        "sys_id": user_sys_id
+    }
 
 def format_article_markdown(article_data, markdown_content, file_path):
     """
@@ -162,63 +329,48 @@ def format_article_markdown(article_data, markdown_content, file_path):
     """
     # Extract and clean up title
     title = (article_data.get('short_description') or article_data.get('title', '')).strip()
-    title = ' '.join(title.split())  # Replace multiple spaces/newlines with a single space
+    title = _whitespace_re.sub(' ', title).strip()  # Replace multiple spaces/newlines with a single space
+
+    # Articles without a title have no usable metadata and are skipped by the caller
+    if not title:
+        raise KeyError('title')
 
     # Get author details using the system ID
-    author_sys_id = article_data.get('author', {}).get('value', '')
+    author_sys_id = article_data.get('author.sys_id', '')
     author_details = get_user_details(author_sys_id)
 
-    # Extract metadata for the article
-    metadata = {
-        'title': title,
-        'author': author_details['name'],
-        'author_sys_id': author_details['sys_id'],
-        'created_date': article_data.get('sys_created_on', ''),
-        'updated_date': article_data.get('sys_updated_on', ''),
-        'views': article_data.get('view_count', 0),
-        'rating': article_data.get('rating', ''),
-        'knowledge_base': article_data.get('kb_knowledge_base.title', ''),
-        'category': article_data.get('kb_category.label', ''),
-        'sys_id': article_data.get('sys_id', '')
-    }
-
-    # Clean up metadata values (remove leading/trailing spaces)
-    metadata = {k: str(v).strip() for k, v in metadata.items() if v}
-
-    # Create frontmatter for the markdown file
-    frontmatter = ['---']
-    for key, value in metadata.items():
-        frontmatter.append(f'{key}: "{value}"')
-    frontmatter.append('---')
+    # Create frontmatter for the markdown file in a single pass over the metadata
+    lines = [
+        '---',
+        f'title: "{title}"',
+        f'author: "{author_details["name"]}"'
+    ]
+    if author_details['sys_id']:
+        lines.append(f'author_sys_id: "{author_details["sys_id"]}"')
+    for key, field in _frontmatter_fields:
+        value = article_data.get(field)
+        if value:
+            lines.append(f'{key}: "{str(value).strip()}"')
+    lines.append('---')
 
     # Remove any duplicate title headers from the content
     content_lines = markdown_content.split('\n')
-    while content_lines and (
-        content_lines[0].strip() == '' or
-        content_lines[0].strip().startswith('# ' + metadata['title']) or
-        content_lines[0].strip() == metadata['title']
-    ):
-        content_lines.pop(0)
-
-    # Clean up content by removing multiple blank lines
-    cleaned_content = []
-    prev_blank = False
+    title_header = '# ' + title
+    start = 0
     for line in content_lines:
-        is_blank = not line.strip()
-        if not (is_blank and prev_blank):  # Only add line if we don't have consecutive blanks
-            cleaned_content.append(line)
-        prev_blank = is_blank
+        line = line.strip()
+        if line and line != title and not line.startswith(title_header):
+            break
+        start += 1
+    content_lines = content_lines[start:]
+
+    # Clean up content by collapsing runs of blank lines into a single blank line
+    cleaned_content = _multiple_blank_lines_re.sub(r'\1', '\n'.join(content_lines))
 
     # Combine frontmatter with cleaned content
-    full_content = [
-        '\n'.join(frontmatter),
-        '',
-        f'# {metadata["title"]}',
-        '',
-        '\n'.join(cleaned_content).strip()
-    ]
+    lines.extend(['', f'# {title}', '', cleaned_content.strip()])
 
-    return '\n'.join(full_content)
+    return '\n'.join(lines)
 
 def print_article_content(original_title, sanitized_title, article_data, file_path):
     """
@@ -235,8 +387,64 @@ def print_article_content(original_title, sanitized_title, article_data, file_pa
     full_markdown = format_article_markdown(article_data, markdown_content, file_path)
 
     # Save the article to the specified file path
-    with open(file_path, 'w', encoding='utf-8') as f:
-        f.write(full_markdown)
+    write_file(file_path, full_markdown.encode('utf-8'))
+
+def _resolve_article_path(article, kb_folder, kb_title, category_folders, used_paths):
+    """
+    Determine where an article is saved, giving it a file name not used earlier in this run
+    :param article: Article record from the knowledge base listing
+    :param kb_folder: Folder of the knowledge base the article belongs to
+    :param kb_title: Sanitized title of the knowledge base
+    :param category_folders: Dictionary of (folder, sanitized title) tuples keyed by category sys_id
+    :param used_paths: Set of lower-cased file paths already assigned during this run
+    :return: Tuple of (original title, sanitized title, file path, display location), or None if skipped
+    """
+    # Get the article ID
+    article_id = article.get('sys_id')
+    if not article_id:
+        return None
+
+    # Extract and sanitize the article title
+    original_title = (article.get('short_description') or
+                    article.get('title', f'Unnamed Article {article_id}')).strip()
+    article_title = sanitize_filename(original_title)
+
+    # Determine the category for saving the article
+    category_id = str(article.get('kb_category', ''))
+
+    # Determine the save location based on category
+    if category_id in category_folders:
+        save_folder, category_title = category_folders[category_id]
+        location = f"{kb_title}/{category_title}"
+    else:
+        save_folder = kb_folder
+        location = kb_title
+
+    # Articles sharing a title (such as versions of the same article) get their sys_id appended,
+    # so concurrent workers never write the same file; compare case-insensitively for Windows and macOS
+    file_path = os.path.join(save_folder, f"{article_title}.md")
+    if file_path.lower() in used_paths:
+        article_title = f"{article_title}-{article_id}"
+        file_path = os.path.join(save_folder, f"{article_title}.md")
+    used_paths.add(file_path.lower())
+
+    return original_title, article_title, file_path, f"{location}/{article_title}.mdx"
+
+def _wait_for_articles(futures):
+    """
+    Wait for submitted articles to finish and report each result
+    :param futures: Dictionary of article futures mapped to their display location
+    """
+    for future in as_completed(futures):
+        try:
+            future.result()
+            print(f"→ {futures[future]}")
+        except KeyError as e:
+            print(f"  Warning: Skipping article due to missing data: {e}")
+            continue
+        except OSError as e:
+            print(f"  Warning: Skipping article that could not be saved: {e}")
+            continue
 
 def main():
     try:
@@ -247,8 +455,7 @@ def main():
 
         # Fetch all knowledge bases from ServiceNow
         print("\nFetching knowledge bases and categories...")
-        kb_response = make_request('GET', kb_bases_endpoint, headers=headers)
-        knowledge_bases = kb_response.get('result', [])
+        knowledge_bases = list(paginated_get(kb_bases_endpoint))
         if not knowledge_bases:
             print("Warning: No knowledge bases found")
             return
@@ -256,14 +463,26 @@ def main():
         # Filter knowledge bases if specified
         if selected_kbs:
             print(f"Filtering knowledge bases: {', '.join(selected_kbs)}")
-            knowledge_bases = [kb for kb in knowledge_bases if kb.get('title', '').strip() in selected_kbs]
+            selected_kb_titles = frozenset(selected_kbs)
+            knowledge_bases = [kb for kb in knowledge_bases if kb.get('title', '').strip() in selected_kb_titles]
             if not knowledge_bases:
                 print("Warning: No matching knowledge bases found")
                 return
 
         # Fetch all categories from ServiceNow
-        cat_response = make_request('GET', kb_categories_endpoint, headers=headers)
-        categories = {str(cat['sys_id']): cat for cat in cat_response.get('result', [])}
+        categories = {str(cat['sys_id']): cat for cat in paginated_get(kb_categories_endpoint)}
+
+        # Sanitize each category name once rather than once per article
+        category_titles = {
+            sys_id: sanitize_filename(category.get('label', 'Unnamed_Category'))
+            for sys_id, category in categories.items()
+        }
+
+        # File paths assigned so far, so no two articles are written to the same file
+        used_paths = set()
+
+        # Knowledge bases whose export was cut short by a request error
+        skipped_kbs = []
 
         # Process each knowledge base
         for kb in knowledge_bases:
@@ -276,65 +495,76 @@ def main():
                 print("-" * (len(kb_title) + 24))  # Underline the knowledge base title
 
                 # Get articles for this knowledge base
-                kb_articles_params = {'knowledge_base': kb['sys_id']}
-                articles_response = make_request('GET', articles_endpoint,
-                                              headers=headers,
-                                              params=kb_articles_params)
-                articles = articles_response.get('result', [])
-
-                if not articles:
-                    print(f"No articles found in knowledge base: {kb_title}")
-                    continue
-
-                # Process each article in the knowledge base
-                for article in articles:
+                kb_articles_params = {
+                    'knowledge_base': kb['sys_id'],
+                    'sysparm_fields': article_fields,
+                    'sysparm_display_value': 'false',
+                    'sysparm_exclude_reference_link': 'true'
+                }
+                category_folders = {}
+                article_count = 0
+                pending = {}
+
+                # Process articles a page at a time; the next page is fetched and prepared while the
+                # workers finish the current one, so at most two pages of article bodies are held in memory
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
                     try:
-                        # Get the article ID
-                        article_id = article.get('sys_id')
-                        if not article_id:
-                            continue
-
-                        # Get the article content with all fields
-                        article_api_endpoint = urljoin(instance_url, f'/api/now/table/kb_knowledge/{article_id}')
-                        article_response = make_request('GET', article_api_endpoint, headers=headers)
-                        article_data = article_response['result']
-
-                        # Extract and sanitize the article title
-                        original_title = (article_data.get('short_description') or
-                                        article_data.get('title', f'Unnamed Article {article_id}')).strip()
-                        article_title = sanitize_filename(original_title)
-
-                        # Determine the category for saving the article
-                        category_id = str(article_data.get('kb_category', ''))
-
-                        # Determine the save location based on category
-                        if category_id and category_id in categories:
-                            category = categories[category_id]
-                            category_title = sanitize_filename(category.get('label', 'Unnamed_Category'))
-                            category_folder = os.path.join(kb_folder, category_title)
-                            create_folder(category_folder)
-                            save_folder = category_folder
-                            location = f"{kb_title}/{category_title}"
-                        else:
-                            save_folder = kb_folder
-                            location = kb_title
-
-                        # Save the article to the appropriate file path
-                        file_path = os.path.join(save_folder, f"{article_title}.md")
-                        print(f"→ {location}/{article_title}.mdx")
-                        print_article_content(original_title, article_title, article_data, file_path)
-
-                    except KeyError as e:
-                        print(f"  Warning: Skipping article due to missing data: {e}")
-                        continue
+                        for articles in paginated_pages(articles_endpoint, kb_articles_params, article_page_size):
+                            article_count += len(articles)
+
+                            # Look up the page's authors up front instead of once per article
+                            prefetch_user_details(article.get('author.sys_id', '') for article in articles)
+
+                            # Create the folder for each category used in this knowledge base once
+                            for article in articles:
+                                category_id = str(article.get('kb_category', ''))
+                                if category_id in category_titles and category_id not in category_folders:
+                                    category_title = category_titles[category_id]
+                                    category_folder = os.path.join(kb_folder, category_title)
+                                    create_folder(category_folder)
+                                    category_folders[category_id] = (category_folder, category_title)
+
+                            # Let the previous page finish before queueing this one
+                            _wait_for_articles(pending)
+
+                            # Assign file paths up front, then process the page's articles concurrently
+                            pending = {}
+                            for article in articles:
+                                resolved = _resolve_article_path(article, kb_folder, kb_title, category_folders, used_paths)
+                                if resolved:
+                                    original_title, article_title, file_path, location = resolved
+                                    future = executor.submit(print_article_content, original_title, article_title, article, file_path)
+                                    pending[future] = location
+                    finally:
+                        # Report queued articles even if fetching the next page failed
+                        _wait_for_articles(pending)
+
+                if not article_count:
+                    print(f"No articles found in knowledge base: {kb_title}")
 
             except KeyError as e:
                 print(f"Warning: Error processing knowledge base: {e}")
                 continue
+            except ServiceNowAuthError:
+                raise
+            except ServiceNowRequestError as e:
+                print(f"Warning: Skipping rest of knowledge base {kb_title}: {e}")
+                skipped_kbs.append(kb_title)
+                continue
+
+        # Exit with an error if any knowledge base was cut short, so scheduled runs can detect it
+        if skipped_kbs:
+            print("\n✗ Knowledge base export completed with errors")
+            print(f"  Incomplete knowledge bases: {', '.join(skipped_kbs)}")
+            print(f"  Articles saved to: {output_folder}")
+            sys.exit(1)
 
         print("\n✓ Knowledge base export completed successfully!")
         print(f"  Articles saved to: {output_folder}")
 
+    except ServiceNowRequestError as e:
+        print(f"\n✗ Error: {e}")
+        sys.exit(1)
     except Exception as e:
         print(f"\n✗ Error: An unexpected error occurred: {e}")
         sys.exit(1)